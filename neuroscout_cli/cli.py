@@ -2,7 +2,7 @@
 neuroscout
 
 Usage:
-    neuroscout run [-mfuvd -i <dir> -w <dir> -s <k> -c <n> -n <nv> -e <es>] <outdir> <bundle_id>...
+    neuroscout run [-mfuvd -i <dir> -w <dir> -s <k> -c <n> -n <nv> -e <es> --mem-gb <gb>] <outdir> <bundle_id>...
     neuroscout install [-ui <dir>] <outdir> <bundle_id>...
     neuroscout upload [-f -n <nv>] <outdir> <bundle_id>...
     neuroscout ls <bundle_id>
@@ -14,6 +14,7 @@ Options:
     -w, --work-dir <dir>     Optional Fitlins working directory 
     -c, --n-cpus <n>         Maximum number of threads across all processes
                              [default: 1]
+    --mem-gb <gb>            Upper bound on memory (GB) for FitLins processes
     -s, --smoothing <k>      Smoothing kernel FWHM at group level
                              [default: 4]
     -u, --unlock             Unlock datalad dataset
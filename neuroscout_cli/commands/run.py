@@ -21,7 +21,9 @@ class Run(Install):
         # Download bundle and install dataset if necessary
         super().run(download_data=(not upload_only))
         
-        model_path = (self.bundle_dir / 'model.json').absolute()
+        bundle_dir = self.bundle_dir.absolute()
+        preproc_dir = self.preproc_dir.absolute()
+        model_path = bundle_dir / 'model.json'
         neurovault = self.options.pop('--neurovault', 'group')
         nv_force = self.options.pop('--force-neurovault', False)
         no_drop = self.options.pop('--no-datalad-drop', False)
@@ -39,12 +41,12 @@ class Run(Install):
             estimator = self.options.pop('--estimator')
 
             fitlins_args = [
-                str(self.preproc_dir.absolute()),
+                str(preproc_dir),
                 str(out_dir),
                 'dataset',
                 f'--model={model_path}',
                 '--ignore=/(.*desc-confounds_regressors.*)/',
-                f'--derivatives={str(self.bundle_dir.absolute())} {str(self.preproc_dir.absolute())}',
+                f'--derivatives={bundle_dir} {preproc_dir}',
                 f'--smoothing={smoothing}:Dataset',
                 f'--estimator={estimator}'
             ]
@@ -130,4 +132,4 @@ class Run(Install):
 
         # Drop files if no separate install dir, and the user has not said otherwise.
         if not self.install_dir and not no_drop:
-            drop(str(self.preproc_dir.absolute()))
\ No newline at end of file
+            drop(str(preproc_dir))
\ No newline at end of file